@@ -1,148 +1,167 @@
 #!/usr/bin/env python3
 
-import requests
-import time
-import json
+import asyncio
+import aiohttp
+import logging
+import random
+import sys
 import threading
-from prometheus_client import start_http_server, Gauge, Counter, Info, REGISTRY
-
-class YouTubeMetrics:
-    """Central class for YouTube metrics"""
+import time
+import orjson
+from prometheus_client import start_http_server, Counter, Info, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger('ytmon')
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+MAX_BATCH_SIZE = 50  # the YouTube API accepts at most 50 IDs per request
+
+# Google APIs only compress responses when the User-Agent also mentions gzip
+HTTP_HEADERS = {
+    'Accept-Encoding': 'gzip',
+    'User-Agent': 'youtube-monitor (gzip)'
+}
+
+# Retry transient API failures: 3 retries with 0.3s, 0.6s, 1.2s delays
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# 403 error reasons the YouTube API uses for exhausted quota and rate limits
+QUOTA_ERROR_REASONS = {'quotaExceeded', 'rateLimitExceeded', 'userRateLimitExceeded', 'dailyLimitExceeded'}
+
+# Longest wait between check cycles while the API keeps rejecting requests
+MAX_BACKOFF = 600
+
+# Channel snippets change rarely, so channel responses are reused for an hour
+CHANNEL_CACHE_TTL = 3600
+
+# (epoch second, formatted timestamp) of the last formatted time
+_ts_cache = (0, '')
+
+def format_timestamp():
+    """Get the current local time as text, formatted at most once per second"""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _ts_cache[1]
+
+class YouTubeCollector:
+    """Prometheus collector building the YouTube gauges from the latest values at scrape time"""
+
+    # Per-stream gauges: (metric name, description, key in the latest values dict)
+    STREAM_GAUGES = [
+        ('youtube_stream_status', 'YouTube stream status (1=LIVE, 0=OFFLINE)', 'status'),
+        ('youtube_stream_viewers', 'YouTube stream viewer count', 'viewers'),
+        ('youtube_video_views', 'Total view count', 'views'),
+        ('youtube_video_likes', 'Like count', 'likes'),
+        ('youtube_video_comments', 'Comment count', 'comments'),
+        ('youtube_video_favorites', 'Favorites count', 'favorites'),
+        ('youtube_engagement_rate', 'Engagement rate (likes/views %)', 'engagement'),
+    ]
 
     def __init__(self):
-        # Metrics for live stream status
-        self.stream_status = Gauge(
-            'youtube_stream_status',
-            'YouTube stream status (1=LIVE, 0=OFFLINE)',
-            ['channel_id', 'stream', 'video_id', 'channel_name', 'environment']
-        )
-
-        self.stream_viewers = Gauge(
-            'youtube_stream_viewers',
-            'YouTube stream viewer count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
-
-        # Video engagement metrics
-        self.video_views = Gauge(
-            'youtube_video_views',
-            'Total view count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
+        # (channel_id, video_id) -> latest values, written by monitors without locking
+        self.streams = {}
+
+        # channel_id -> latest subscriber count, shared by all streams of the channel
+        self.channels = {}
+        self._lock = threading.Lock()
+
+    def track(self, channel_id, video_id):
+        """Get the latest values dict of a stream, all gauges start at 0"""
+        with self._lock:
+            # Channels are added here, so monitors only ever update existing keys
+            self.channels.setdefault(channel_id, 0)
+            keys = [key for _, _, key in self.STREAM_GAUGES]
+            return self.streams.setdefault((channel_id, video_id), dict.fromkeys(keys, 0))
+
+    def collect(self):
+        """Yield all gauges, called by prometheus_client on each scrape"""
+        with self._lock:
+            streams = list(self.streams.items())
+            channels = list(self.channels.items())
+
+        for name, documentation, key in self.STREAM_GAUGES:
+            gauge = GaugeMetricFamily(name, documentation, labels=['channel_id', 'video_id'])
+            for labels, values in streams:
+                gauge.add_metric(labels, values[key])
+            yield gauge
 
-        self.video_likes = Gauge(
-            'youtube_video_likes',
-            'Like count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
-
-        self.video_comments = Gauge(
-            'youtube_video_comments',
-            'Comment count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
-
-        self.video_favorites = Gauge(
-            'youtube_video_favorites',
-            'Favorites count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
+        # Channel metrics
+        gauge = GaugeMetricFamily('youtube_channel_subscribers', 'Channel subscriber count', labels=['channel_id'])
+        for channel_id, value in channels:
+            gauge.add_metric([channel_id], value)
+        yield gauge
 
-        self.engagement_rate = Gauge(
-            'youtube_engagement_rate',
-            'Engagement rate (likes/views %)',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
-        )
+class YouTubeMetrics:
+    """Central class for YouTube metrics"""
 
-        # Channel metrics
-        self.channel_subscribers = Gauge(
-            'youtube_channel_subscribers',
-            'Channel subscriber count',
-            ['channel_id', 'stream', 'channel_name']
-        )
+    def __init__(self):
+        # Gauges are built at scrape time from the latest values of each stream
+        self.collector = YouTubeCollector()
+        REGISTRY.register(self.collector)
 
         # Statistical counters - Same labels will be used for all channels
         self.check_count = Counter(
             'youtube_stream_check_count',
             'Total check count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
+            ['channel_id', 'video_id']
         )
 
         self.error_count = Counter(
             'youtube_stream_error_count',
             'Total error count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
+            ['channel_id', 'video_id']
         )
 
         self.api_errors = Counter(
             'youtube_api_errors',
             'YouTube API error count',
-            ['channel_id', 'stream', 'video_id', 'channel_name']
+            ['channel_id', 'video_id']
         )
 
-        # Channel information (metadata)
+        # Channel information (metadata) - only data reported by the API for the channel
         self.channel_info = Info(
             'youtube_channel',
             'YouTube channel information',
-            ['channel_id', 'channel_name']
+            ['channel_id']
         )
 
-        # Video information (metadata)
+        # Video information (metadata) - per-stream config (stream name, channel name, environment) is kept here
         self.video_info = Info(
             'youtube_video',
             'YouTube video information',
-            ['video_id', 'channel_id', 'stream']
+            ['video_id', 'channel_id']
         )
 
-        # List of monitored streams
-        self.registered_streams = set()
+        # Monitored streams, guarded by a lock as monitors may be created concurrently
+        self._registration = {}
+        self._lock = threading.Lock()
 
     def register_stream(self, channel_id, video_id, stream_name, channel_name, environment="Production"):
-        """Register a new stream and initialize its basic metrics"""
-        stream_key = f"{channel_id}_{video_id}_{stream_name}"
+        """Register a new stream and initialize its counters, returning False if it is already registered"""
+        # Same identity as the metric series, a video is only counted once
+        stream_key = f"{channel_id}_{video_id}"
 
-        if stream_key in self.registered_streams:
-            return
+        with self._lock:
+            if self._registration.setdefault(stream_key, False):
+                return False
+            self._registration[stream_key] = True
 
         # Basic labels
         base_labels = {
             'channel_id': channel_id,
-            'stream': stream_name,
-            'video_id': video_id,
-            'channel_name': channel_name
+            'video_id': video_id
         }
 
-        status_labels = {
-            'channel_id': channel_id,
-            'stream': stream_name,
-            'video_id': video_id,
-            'channel_name': channel_name,
-            'environment': environment
-        }
-
-        # Initialize all gauge metrics as 0
-        self.stream_status.labels(**status_labels).set(0)
-        self.stream_viewers.labels(**base_labels).set(0)
-        self.video_views.labels(**base_labels).set(0)
-        self.video_likes.labels(**base_labels).set(0)
-        self.video_comments.labels(**base_labels).set(0)
-        self.video_favorites.labels(**base_labels).set(0)
-        self.engagement_rate.labels(**base_labels).set(0)
-
-        # Channel metrics
-        channel_labels = {
-            'channel_id': channel_id,
-            'stream': stream_name,
-            'channel_name': channel_name
-        }
-        self.channel_subscribers.labels(**channel_labels).set(0)
+        # Gauges need no initialization: YouTubeMonitor tracks their latest values, which start at 0
 
         # Initialize counters (these counters will be increased with Inc() first, but we're registering them now to see the metrics)
         # Set initial values to 0
         self.initialize_counters(base_labels)
-
-        # Mark the stream as registered
-        self.registered_streams.add(stream_key)
+        return True
 
     def initialize_counters(self, labels):
         """Initialize basic counters - Prometheus won't show counters without calling this function"""
@@ -155,7 +174,7 @@ class YouTubeMetrics:
             self.check_count.labels(**labels).inc(0)
             self.error_count.labels(**labels).inc(0)
         except Exception as e:
-            print(f"Error initializing counters: {str(e)}")
+            logger.error("Error initializing counters: %s", e)
 
 class YouTubeMonitor:
     """Class for monitoring a YouTube stream"""
@@ -182,55 +201,43 @@ class YouTubeMonitor:
 
         # Labels for metrics
         self.base_labels = {
-            'stream': stream_name,
-            'video_id': video_id,
-            'channel_id': channel_id,
-            'channel_name': channel_name
-        }
-
-        self.status_labels = {
-            'stream': stream_name,
             'video_id': video_id,
-            'channel_id': channel_id,
-            'channel_name': channel_name,
-            'environment': environment
-        }
-
-        self.channel_labels = {
-            'stream': stream_name,
-            'channel_id': channel_id,
-            'channel_name': channel_name
+            'channel_id': channel_id
         }
 
         # Metrics class instance
         self.metrics = metrics if metrics else YouTubeMetrics()
 
         # Register stream and initialize metrics
-        self.metrics.register_stream(channel_id, video_id, stream_name, channel_name, environment)
+        if not self.metrics.register_stream(channel_id, video_id, stream_name, channel_name, environment):
+            raise ValueError(f"Video {video_id} of channel {channel_id} is already monitored")
 
-        # Record channel information (metadata)
-        self.metrics.channel_info.labels(channel_id=channel_id, channel_name=channel_name).info({
-            'stream_name': stream_name,
-            'environment': environment
-        })
+        # Latest gauge values, read by the collector on scrape
+        self._latest = self.metrics.collector.track(channel_id, video_id)
 
-    def check_stream_status(self):
-        """Check live stream status using YouTube API"""
+        # Bind labelled counter children once so updates skip the labels() lookup
+        self._m_check_count = self.metrics.check_count.labels(**self.base_labels)
+        self._m_error_count = self.metrics.error_count.labels(**self.base_labels)
+        self._m_api_errors = self.metrics.api_errors.labels(**self.base_labels)
+
+        # (title, is_live) last recorded in the video information metadata
+        self._video_info_state = None
+
+    def check_stream_status(self, item, error=None):
+        """Update live stream status from a video item of a batched API response"""
         try:
             # Increase check counter for each check - WHETHER THERE IS AN ERROR OR NOT
-            self.metrics.check_count.labels(**self.base_labels).inc()
+            self._m_check_count.inc()
 
-            # Get video details using API
-            url = f"https://www.googleapis.com/youtube/v3/videos?part=snippet,liveStreamingDetails&id={self.video_id}&key={self.api_key}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
+            # Batch request failed
+            if error:
+                raise error
 
             is_live = False
             viewer_count = 0
             video_title = ""
 
-            if 'items' in data and data['items']:
-                item = data['items'][0]
+            if item:
                 # Check stream status
                 if 'snippet' in item:
                     if item['snippet'].get('liveBroadcastContent') == 'live':
@@ -243,52 +250,53 @@ class YouTubeMonitor:
                 if 'liveStreamingDetails' in item and 'concurrentViewers' in item['liveStreamingDetails']:
                     viewer_count = int(item['liveStreamingDetails']['concurrentViewers'])
 
-            # Record video information (metadata)
-            self.metrics.video_info.labels(
-                video_id=self.video_id,
-                channel_id=self.channel_id,
-                stream=self.stream_name
-            ).info({
-                'title': video_title,
-                'is_live': str(is_live),
-                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
-            })
+            # Record video information (metadata), only when it changed
+            if self._video_info_state != (video_title, is_live):
+                self._video_info_state = (video_title, is_live)
+                self.metrics.video_info.labels(
+                    video_id=self.video_id,
+                    channel_id=self.channel_id
+                ).info({
+                    'stream_name': self.stream_name,
+                    'channel_name': self.channel_name,
+                    'environment': self.environment,
+                    'title': video_title,
+                    'is_live': str(is_live),
+                    'last_updated': format_timestamp()
+                })
 
             # Update metrics
-            self.metrics.stream_status.labels(**self.status_labels).set(1 if is_live else 0)
+            self._latest['status'] = 1 if is_live else 0
 
             # Update viewer count always (even if it's 0)
-            self.metrics.stream_viewers.labels(**self.base_labels).set(viewer_count)
+            self._latest['viewers'] = viewer_count
 
             status_text = "LIVE" if is_live else "OFFLINE"
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp} - {self.stream_name} ({self.channel_name}) YouTube Stream {status_text}, Viewers: {viewer_count}")
+            logger.info("%s (%s) YouTube Stream %s, Viewers: %s", self.stream_name, self.channel_name, status_text, viewer_count)
 
             # If stream is offline, increase error counter
             if not is_live:
-                self.metrics.error_count.labels(**self.base_labels).inc()
+                self._m_error_count.inc()
 
             return is_live, viewer_count, video_title
 
         except Exception as e:
             # In case of API error
-            self.metrics.stream_status.labels(**self.status_labels).set(0)
-            self.metrics.error_count.labels(**self.base_labels).inc()
-            self.metrics.api_errors.labels(**self.base_labels).inc()
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp} - {self.stream_name} ({self.channel_name}) API ERROR: {str(e)}")
+            self._latest['status'] = 0
+            self._m_error_count.inc()
+            self._m_api_errors.inc()
+            logger.error("%s (%s) API ERROR: %r", self.stream_name, self.channel_name, e)
             return False, 0, ""
 
-    def get_video_engagement(self):
-        """Get video engagement metrics (likes, comments, views)"""
+    def get_video_engagement(self, item, error=None):
+        """Update video engagement metrics (likes, comments, views) from a batched API response"""
         try:
-            # Get video statistics
-            url = f"https://www.googleapis.com/youtube/v3/videos?part=statistics&id={self.video_id}&key={self.api_key}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
+            # Batch request failed
+            if error:
+                raise error
 
-            if 'items' in data and data['items']:
-                stats = data['items'][0]['statistics']
+            if item:
+                stats = item['statistics']
 
                 # Get metrics (use 0 if not available)
                 views = int(stats.get('viewCount', 0))
@@ -297,37 +305,33 @@ class YouTubeMonitor:
                 favorites = int(stats.get('favoriteCount', 0))
 
                 # Update Prometheus metrics
-                self.metrics.video_views.labels(**self.base_labels).set(views)
-                self.metrics.video_likes.labels(**self.base_labels).set(likes)
-                self.metrics.video_comments.labels(**self.base_labels).set(comments)
-                self.metrics.video_favorites.labels(**self.base_labels).set(favorites)
+                self._latest['views'] = views
+                self._latest['likes'] = likes
+                self._latest['comments'] = comments
+                self._latest['favorites'] = favorites
 
                 # Calculate engagement rate (likes per view)
                 if views > 0:
                     engagement_rate = (likes / views) * 100
-                    self.metrics.engagement_rate.labels(**self.base_labels).set(engagement_rate)
+                    self._latest['engagement'] = engagement_rate
 
-                timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-                print(f"{timestamp} - {self.stream_name} ({self.channel_name}) Views: {views}, Likes: {likes}, Comments: {comments}")
+                logger.info("%s (%s) Views: %s, Likes: %s, Comments: %s", self.stream_name, self.channel_name, views, likes, comments)
                 return views, likes, comments
 
         except Exception as e:
             # Increase api_errors counter for each API error
-            self.metrics.api_errors.labels(**self.base_labels).inc()
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp} - {self.stream_name} ({self.channel_name}) Failed to get engagement data: {str(e)}")
+            self._m_api_errors.inc()
+            logger.error("%s (%s) Failed to get engagement data: %r", self.stream_name, self.channel_name, e)
             return 0, 0, 0
 
-    def get_channel_info(self):
-        """Get channel information (subscriber count, etc.)"""
+    def get_channel_info(self, item, error=None):
+        """Update channel information (subscriber count, etc.) from a batched API response"""
         try:
-            # Get channel statistics
-            url = f"https://www.googleapis.com/youtube/v3/channels?part=statistics,snippet&id={self.channel_id}&key={self.api_key}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
+            # Batch request failed
+            if error:
+                raise error
 
-            if 'items' in data and data['items']:
-                item = data['items'][0]
+            if item:
                 stats = item['statistics']
                 snippet = item.get('snippet', {})
 
@@ -335,73 +339,335 @@ class YouTubeMonitor:
                 subscriber_count = int(stats.get('subscriberCount', 0))
 
                 # Update channel metrics
-                self.metrics.channel_subscribers.labels(**self.channel_labels).set(subscriber_count)
+                self.metrics.collector.channels[self.channel_id] = subscriber_count
 
                 # Update channel information
                 self.metrics.channel_info.labels(
-                    channel_id=self.channel_id,
-                    channel_name=self.channel_name
+                    channel_id=self.channel_id
                 ).info({
                     'title': snippet.get('title', ''),
                     'description': snippet.get('description', '')[:100] + '...',
                     'subscriber_count': str(subscriber_count),
-                    'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
+                    'last_updated': format_timestamp()
                 })
 
-                timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-                print(f"{timestamp} - {self.stream_name} ({self.channel_name}) Channel subscriber count: {subscriber_count}")
+                logger.info("%s (%s) Channel subscriber count: %s", self.stream_name, self.channel_name, subscriber_count)
                 return subscriber_count
 
         except Exception as e:
             # In case of API error
-            self.metrics.api_errors.labels(**self.base_labels).inc()
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp} - {self.stream_name} ({self.channel_name}) Failed to get channel information: {str(e)}")
+            self._m_api_errors.inc()
+            logger.error("%s (%s) Failed to get channel information: %r", self.stream_name, self.channel_name, e)
             return 0
 
-    def monitor_loop(self, interval=30):
-        """Continuous monitoring loop"""
-        engagement_interval = 5  # update engagement data every 5 check cycles
-        channel_interval = 10    # update channel information every 10 check cycles
-
-        count = 0
-        while True:
-            # Check stream status
-            self.check_stream_status()
-
-            # Check engagement metrics at specific intervals
-            if count % engagement_interval == 0:
-                self.get_video_engagement()
-
-            # Update channel information at specific intervals
-            if count % channel_interval == 0:
-                self.get_channel_info()
-
-            count += 1
-
-            # Check at specified intervals
-            time.sleep(interval)
-
-def run_monitor(stream_config, metrics, interval=30):
-    """Run a monitor"""
-    monitor = YouTubeMonitor(
-        stream_config['channel_id'],
-        stream_config['video_id'],
-        stream_config['api_key'],
-        stream_config['name'],
-        stream_config['channel_name'],
-        stream_config.get('environment', 'Production'),
-        metrics
-    )
+class BatchFetcher:
+    """Fetch YouTube API data for all monitors with batched requests"""
+
+    def __init__(self, session, monitors, interval=30):
+        """
+        Initialize batch fetcher
+
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session for API calls
+            monitors (list): YouTubeMonitor instances to update
+            interval (int): Seconds between check cycles
+        """
+        self.session = session
+        self.interval = interval
+        self.engagement_interval = 5  # update engagement data every 5 check cycles
+        self.channel_interval = 10    # update channel information every 10 check cycles
+
+        # (request URL, API key) -> (ETag, items) of the last successful response
+        self._etags = {}
+
+        # channel_id -> (fetch time, future resolving to the items of its batch request)
+        self._channel_cache = {}
+
+        # Running check cycles, referenced so they are not garbage collected
+        self._tasks = set()
+
+        # Group monitors by API key, each batch fits into a single request
+        monitors_by_key = {}
+        for monitor in monitors:
+            monitors_by_key.setdefault(monitor.api_key, []).append(monitor)
+
+        self.batches = []
+        for api_key, key_monitors in monitors_by_key.items():
+            for i in range(0, len(key_monitors), MAX_BATCH_SIZE):
+                self.batches.append((api_key, key_monitors[i:i + MAX_BATCH_SIZE]))
+
+    @staticmethod
+    async def raise_for_status(response):
+        """Raise ClientResponseError for a non-2xx response, with the API error reason as message"""
+        if 200 <= response.status < 300:
+            return
+
+        try:
+            reason = orjson.loads(await response.read())['error']['errors'][0]['reason']
+        except Exception:
+            reason = response.reason
+
+        raise aiohttp.ClientResponseError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=reason,
+            headers=response.headers
+        )
+
+    async def fetch_items(self, resource, part, ids, api_key, fields):
+        """
+        Get API items for a list of IDs with a single request
+
+        Only the item fields listed in `fields` are returned by the API (partial response).
+
+        Returns:
+            dict: Items keyed by ID, the cached items if the response was 304 Not Modified
+        """
+        url = f"{YOUTUBE_API_URL}/{resource}?part={part}&fields=items({fields})&id={','.join(ids)}"
+        cache_key = (url, api_key)
+
+        # The key goes in a header so it never shows up in error messages and logs
+        headers = {'X-Goog-Api-Key': api_key}
 
-    print(f"Monitoring started: {stream_config['name']} - {stream_config['channel_name']} - Video ID: {stream_config['video_id']}")
-    monitor.monitor_loop(interval)
+        # Ask for the body only if it changed since the last response
+        cached = self._etags.get(cache_key)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        try:
+            for attempt in range(RETRY_TOTAL + 1):
+                retries_left = attempt < RETRY_TOTAL
+                try:
+                    async with self.session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        # Unchanged, reuse the cached items without decoding a body
+                        if response.status == 304:
+                            return cached[1]
+
+                        # Retry transient errors, report any other error response to the monitors
+                        if response.status not in RETRY_STATUSES or not retries_left:
+                            await self.raise_for_status(response)
+                            status = response.status
+                            etag = response.headers.get('ETag')
+                            data = orjson.loads(await response.read())
+                            break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if isinstance(e, aiohttp.ClientResponseError) or not retries_left:
+                        raise
+
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+            items = {item['id']: item for item in data.get('items', [])}
+        except Exception:
+            # Monitors record the failure, so the next response must be a full one
+            self._etags.pop(cache_key, None)
+            raise
+
+        if status == 200 and etag:
+            self._etags[cache_key] = (etag, items)
+        else:
+            self._etags.pop(cache_key, None)
+
+        return items
+
+    async def fetch_channels(self, ids, api_key):
+        """
+        Get channel items, reusing responses younger than CHANNEL_CACHE_TTL
+
+        Returns:
+            dict: Items keyed by channel ID, the request error for channels whose shared request failed
+        """
+        now = time.monotonic()
+        stale = [cid for cid in ids if cid not in self._channel_cache or now - self._channel_cache[cid][0] >= CHANNEL_CACHE_TTL]
+
+        if stale:
+            # Cache the in-flight request so concurrent callers share a single HTTP call
+            future = asyncio.ensure_future(self.fetch_items(
+                'channels', 'statistics,snippet', stale, api_key,
+                'id,snippet(title,description),statistics(subscriberCount)'
+            ))
+            for cid in stale:
+                self._channel_cache[cid] = (now, future)
+
+        # Take the futures before awaiting, other batches may evict entries meanwhile
+        futures = {cid: self._channel_cache[cid][1] for cid in ids}
+
+        items = {}
+        for cid, future in futures.items():
+            try:
+                result = await future
+            except Exception as e:
+                # Forget the failed request so the next cycle retries it
+                for key in [key for key, (_, cached) in self._channel_cache.items() if cached is future]:
+                    del self._channel_cache[key]
+                items[cid] = e
+                continue
+
+            if cid in result:
+                items[cid] = result[cid]
+            elif self._channel_cache.get(cid, (None, None))[1] is future:
+                # Channel missing from the response, ask for it again next cycle
+                del self._channel_cache[cid]
+
+        return items
+
+    async def dispatch(self, monitors, fetch, id_attr, *handlers):
+        """
+        Fetch a batch and pass each monitor the item matching its ID
+
+        `fetch` may return an exception in place of an item when only that ID failed.
+
+        Returns:
+            Exception: The request error, if any
+        """
+        # Streams sharing a video or channel are only requested once
+        ids = list(dict.fromkeys(getattr(monitor, id_attr) for monitor in monitors))
+
+        try:
+            items = await fetch(ids)
+        except Exception as e:
+            for monitor in monitors:
+                for handler in handlers:
+                    handler(monitor, None, error=e)
+            return e
+
+        error = None
+        for monitor in monitors:
+            item = items.get(getattr(monitor, id_attr))
+            if isinstance(item, Exception):
+                error = item
+                for handler in handlers:
+                    handler(monitor, None, error=item)
+                continue
+
+            for handler in handlers:
+                handler(monitor, item)
+
+        return error
+
+    @staticmethod
+    def is_throttled(error):
+        """Check whether a request error asks us to slow down (quota exceeded, rate limited or server error)"""
+        if not isinstance(error, aiohttp.ClientResponseError):
+            return False
+
+        return error.status == 429 or error.status >= 500 or (error.status == 403 and error.message in QUOTA_ERROR_REASONS)
+
+    async def poll_batch(self, api_key, monitors, count):
+        """Run one check cycle for a batch of monitors, returning True if the API is throttling us"""
+        # Check stream status
+        part = 'snippet,liveStreamingDetails'
+        fields = 'id,snippet(title,liveBroadcastContent),liveStreamingDetails(concurrentViewers)'
+        handlers = [YouTubeMonitor.check_stream_status]
+
+        # Check engagement metrics at specific intervals, from the same response
+        if count % self.engagement_interval == 0:
+            part += ',statistics'
+            fields += ',statistics'
+            handlers.append(YouTubeMonitor.get_video_engagement)
+
+        error = await self.dispatch(monitors, lambda ids: self.fetch_items('videos', part, ids, api_key, fields),
+                                    'video_id', *handlers)
+        if self.is_throttled(error):
+            return True
+
+        # Update channel information at specific intervals
+        if count % self.channel_interval == 0:
+            error = await self.dispatch(monitors, lambda ids: self.fetch_channels(ids, api_key),
+                                        'channel_id', YouTubeMonitor.get_channel_info)
+            if self.is_throttled(error):
+                return True
+
+        return False
+
+    def schedule_batch(self, api_key, monitors, when, count, backoff=0):
+        """Schedule a check cycle for a batch at the given event loop time"""
+        asyncio.get_running_loop().call_at(when, self.start_batch, api_key, monitors, when, count, backoff)
+
+    def start_batch(self, api_key, monitors, when, count, backoff):
+        """Start a scheduled check cycle and queue the next one when it finishes"""
+        task = asyncio.create_task(self.poll_batch(api_key, monitors, count))
+        self._tasks.add(task)
+
+        def requeue(task):
+            self._tasks.discard(task)
+
+            # Shutting down, do not queue further cycles
+            if task.cancelled():
+                return
+
+            throttled = False
+            if task.exception():
+                logger.error("Check cycle failed: %s", task.exception())
+            else:
+                throttled = task.result()
+
+            loop = asyncio.get_running_loop()
+            if throttled:
+                # Back off exponentially with jitter instead of retrying into a failing quota window
+                next_backoff = min(MAX_BACKOFF, max(self.interval, backoff * 2))
+                delay = min(MAX_BACKOFF, next_backoff * random.uniform(1, 1.2))
+                logger.warning("YouTube API is throttling requests, next check in %.0f seconds", delay)
+                self.schedule_batch(api_key, monitors, loop.time() + delay, count + 1, next_backoff)
+            else:
+                # Keep a fixed rate, but never start a cycle before the previous one finished
+                self.schedule_batch(api_key, monitors, max(when + self.interval, loop.time()), count + 1)
+
+        task.add_done_callback(requeue)
+
+    async def run(self):
+        """Run all batches, spreading their requests evenly over the check interval"""
+        if not self.batches:
+            logger.info("No streams to monitor.")
+            return
+
+        start = asyncio.get_running_loop().time()
+        offset = self.interval / len(self.batches)
+        for i, (api_key, monitors) in enumerate(self.batches):
+            self.schedule_batch(api_key, monitors, start + offset * i, 0)
+
+        # Check cycles run from event loop callbacks until the program stops
+        await asyncio.Event().wait()
+
+async def monitor_streams(streams, metrics, interval=30):
+    """Monitor all streams with batched API calls on a single event loop"""
+    monitors = []
+    for stream_config in streams:
+        try:
+            monitors.append(YouTubeMonitor(
+                stream_config['channel_id'],
+                stream_config['video_id'],
+                stream_config['api_key'],
+                stream_config['name'],
+                stream_config['channel_name'],
+                stream_config.get('environment', 'Production'),
+                metrics
+            ))
+        except ValueError as e:
+            logger.warning("Skipping %s: %s", stream_config['name'], e)
+            continue
+
+        logger.info("Monitoring started: %s - %s - Video ID: %s", stream_config['name'], stream_config['channel_name'], stream_config['video_id'])
+
+    # One HTTP session shared by every batch, keeping connections alive between check cycles
+    connector = aiohttp.TCPConnector(limit=len(streams) * 2, keepalive_timeout=interval * 2)
+    async with aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS) as session:
+        fetcher = BatchFetcher(session, monitors, interval)
+        await fetcher.run()
 
 def main():
+    # Log to stdout with the same timestamp format as before
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        stream=sys.stdout
+    )
+
     # Start Prometheus HTTP server
     prometheus_port = 8001
     start_http_server(prometheus_port)
-    print(f"Prometheus metrics server started: http://localhost:{prometheus_port}")
+    logger.info("Prometheus metrics server started: http://localhost:%s", prometheus_port)
 
     # Create central metrics class
     metrics = YouTubeMetrics()
@@ -426,26 +692,14 @@ def main():
         }
     ]
 
-    print(f"Monitoring a total of {len(streams)} streams...")
+    logger.info("Monitoring a total of %s streams...", len(streams))
 
-    # Start separate thread for each stream
-    threads = []
+    # Run all monitors on a single asyncio event loop
     try:
-        for stream in streams:
-            thread = threading.Thread(target=run_monitor, args=(stream, metrics, 30))
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-
-            # Wait 1 second between threads to distribute API calls
-            time.sleep(1)
-
-        # For the main thread to wait for other threads
-        for thread in threads:
-            thread.join()
+        asyncio.run(monitor_streams(streams, metrics, 30))
 
     except KeyboardInterrupt:
-        print("Monitoring stopped.")
+        logger.info("Monitoring stopped.")
 
 if __name__ == "__main__":
     main()